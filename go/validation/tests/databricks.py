@@ -17,13 +17,18 @@ from pathlib import Path
 
 from adbc_drivers_validation import model, quirks
 
+_TABLE_RE = re.compile(r"table", re.IGNORECASE)
+_NOT_FOUND_RE = re.compile(
+    r"does not exist|doesn't exist|not found|cannot be found", re.IGNORECASE
+)
+
 
 class DatabricksQuirks(model.DriverQuirks):
     name = "databricks"
     driver = "adbc_driver_databricks"
     driver_name = "ADBC Driver Foundry Driver for Databricks"
     vendor_name = "Databricks"
-    vendor_version = re.compile(r"(17\.[0-9]+.*|2025\.[0-9]+)")
+    vendor_version = re.compile(r"(?:17\.\d+.*|2025\.\d+)", re.ASCII)
     short_version = "17"
     features = model.DriverFeatures(
         connection_get_table_schema=False,
@@ -72,16 +77,11 @@ class DatabricksQuirks(model.DriverQuirks):
 
     def is_table_not_found(self, table_name: str, error: Exception) -> bool:
         # Check if the error indicates a table not found condition
-        error_str = str(error).lower()
-        return (
-            "table" in error_str
-            and (
-                "does not exist" in error_str
-                or "doesn't exist" in error_str
-                or "not found" in error_str
-                or "cannot be found" in error_str
-            )
-            and table_name.lower() in error_str
+        error_str = str(error)
+        return bool(
+            _TABLE_RE.search(error_str)
+            and _NOT_FOUND_RE.search(error_str)
+            and table_name.lower() in error_str.lower()
         )
 
     def quote_one_identifier(self, identifier: str) -> str:
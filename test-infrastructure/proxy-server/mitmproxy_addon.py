@@ -21,27 +21,66 @@ Control API runs on port 18081 (compatible with existing test infrastructure).
 Proxy listens on port 18080.
 """
 
+import asyncio
+import re
 import threading
 import time
-from typing import Any, Dict, List
+from collections import Counter, deque
+from types import MappingProxyType
+from typing import Any, Deque, Dict, List, Mapping, Optional, Tuple
 
-from flask import Flask, jsonify, request
+import orjson
+from flask import Flask, Response, request
 from mitmproxy import ctx, http
 from thrift_decoder import decode_thrift_message, format_thrift_message
+from waitress import serve
 
 # Flask app for control API
 app = Flask(__name__)
 
-# Global state for enabled scenarios (thread-safe with lock)
+# Global state for enabled scenarios (thread-safe with lock).
+# Maps scenario name to its effective config; absent means disabled.
 state_lock = threading.Lock()
-enabled_scenarios: Dict[str, bool] = {}
+enabled_scenarios: Dict[str, Mapping[str, Any]] = {}
+
+# Enabled (name, config) pairs grouped by scenario operation, in enable
+# order, for the proxy hot path. Thrift method buckets also hold the enabled
+# ThriftOperation scenarios. Rebuilt under state_lock after every change and
+# rebound in one assignment, so readers can use it without taking the lock.
+# Empty when no scenario is enabled.
+enabled_by_operation: Dict[str, Tuple[Tuple[str, Mapping[str, Any]], ...]] = {}
+
+# Serialized GET /scenarios body, republished with enabled_by_operation
+scenarios_body = b""
 
 # Call count tracking for trigger_after_count scenarios
 scenario_call_counts: Dict[str, int] = {}
 
 # Call tracking state (thread-safe with lock)
 MAX_CALL_HISTORY = 1000
-call_history: List[Dict[str, Any]] = []
+call_history: Deque[Dict[str, Any]] = deque(maxlen=MAX_CALL_HISTORY)
+
+# Thrift method names in call order, with per-method counts kept in step,
+# so verification does not have to walk call_history
+thrift_methods: Deque[str] = deque(maxlen=MAX_CALL_HISTORY)
+thrift_method_counts: Counter = Counter()
+
+# Cloud download recording is opt-in (POST /tracking/cloud-downloads)
+record_cloud_downloads = False
+
+# Decoding and logging Thrift responses is opt-in (POST /thrift/decode-responses)
+decode_thrift_responses = False
+
+# Keeping decoded request fields in call history is opt-in
+# (POST /thrift/capture-fields)
+capture_thrift_fields = False
+
+# Cloud storage hosts serving CloudFetch result files
+CLOUD_STORAGE_HOST_SUFFIXES = (
+    "blob.core.windows.net",
+    "s3.amazonaws.com",
+    "storage.googleapis.com",
+)
 
 # Load scenario definitions from YAML (we'll parse the existing config)
 SCENARIOS = {
@@ -187,6 +226,160 @@ SCENARIOS = {
     },
 }
 
+# Scenario definitions are shared with enabled_scenarios and the prebuilt
+# responses below, so expose them and each config read-only
+SCENARIOS = MappingProxyType(
+    {name: MappingProxyType(config) for name, config in SCENARIOS.items()}
+)
+
+# Static part of the GET /scenarios listing
+SCENARIO_DESCRIPTIONS = tuple(
+    (name, config["description"]) for name, config in SCENARIOS.items()
+)
+
+# Thrift requests use /sql/1.0/warehouses/ or /sql/1.0/endpoints/ paths
+THRIFT_PATH_RE = re.compile(r"/sql/1\.0/(?:warehouses|endpoints)/")
+
+# termlog_verbosity values at which ctx.log.info output is shown
+INFO_LOG_VERBOSITIES = frozenset({"info", "debug"})
+
+# Response headers and bodies shared by injected failures
+TEXT_PLAIN_HEADERS = {"Content-Type": "text/plain"}
+THRIFT_HEADERS = {"Content-Type": "application/x-thrift"}
+EXPIRED_LINK_BODY = (
+    b"AuthorizationQueryParametersError: "
+    b"Query Parameters are not supported for this operation"
+)
+CONNECTION_RESET_BODY = b"Connection reset by peer"
+
+
+def _error_response(config: Mapping[str, Any]) -> Optional[Tuple[int, bytes, dict]]:
+    """Build the static (status code, body, headers) for an error scenario."""
+    action = config["action"]
+    if action == "return_error":
+        return (
+            config["error_code"],
+            config["error_message"].encode("utf-8"),
+            TEXT_PLAIN_HEADERS,
+        )
+    if action == "return_thrift_error":
+        # For simplicity, return HTTP 500 with error message
+        # A full implementation would construct proper Thrift error response
+        error_type = config.get("error_type", "UNKNOWN_ERROR")
+        error_message = config.get("error_message", "Thrift operation failed")
+        return (
+            500,
+            f"Thrift Error [{error_type}]: {error_message}".encode("utf-8"),
+            THRIFT_HEADERS,
+        )
+    if action == "return_auth_error":
+        error_type = config.get("error_type", "UNAUTHORIZED")
+        error_message = config.get("error_message", "Authentication failed")
+        return (
+            401,
+            f"Authentication Error [{error_type}]: {error_message}".encode("utf-8"),
+            THRIFT_HEADERS,
+        )
+    return None
+
+
+# Error responses are fixed per scenario, so encode them once at import
+ERROR_RESPONSES = {
+    name: response
+    for name, config in SCENARIOS.items()
+    if (response := _error_response(config)) is not None
+}
+
+
+def _clear_call_history() -> None:
+    """Clear call history and method tracking. Caller must hold state_lock."""
+    call_history.clear()
+    thrift_methods.clear()
+    thrift_method_counts.clear()
+
+
+def _record_thrift_method(method: str) -> None:
+    """Track a Thrift method call. Caller must hold state_lock."""
+    if len(thrift_methods) == MAX_CALL_HISTORY:
+        # The append below evicts the oldest method
+        evicted = thrift_methods[0]
+        thrift_method_counts[evicted] -= 1
+        if not thrift_method_counts[evicted]:
+            del thrift_method_counts[evicted]
+    thrift_methods.append(method)
+    thrift_method_counts[method] += 1
+
+
+def _publish_enabled_scenarios() -> None:
+    """
+    Rebuild enabled_by_operation and scenarios_body. Caller must hold
+    state_lock.
+    """
+    global enabled_by_operation, scenarios_body
+    by_operation: Dict[str, List[Tuple[str, Mapping[str, Any]]]] = {}
+    for name, config in enabled_scenarios.items():
+        by_operation.setdefault(SCENARIOS[name]["operation"], []).append((name, config))
+    # ThriftOperation scenarios match every Thrift method. Fold them into each
+    # method bucket in enable order, so the first enabled match still wins.
+    if "ThriftOperation" in by_operation:
+        for op in by_operation:
+            if op not in ("ThriftOperation", "CloudFetchDownload"):
+                by_operation[op] = [
+                    (name, config)
+                    for name, config in enabled_scenarios.items()
+                    if SCENARIOS[name]["operation"] in (op, "ThriftOperation")
+                ]
+    enabled_by_operation = {op: tuple(pairs) for op, pairs in by_operation.items()}
+    scenarios_body = orjson.dumps(
+        {
+            "scenarios": [
+                {
+                    "name": name,
+                    "description": description,
+                    "enabled": name in enabled_scenarios,
+                }
+                for name, description in SCENARIO_DESCRIPTIONS
+            ]
+        }
+    )
+
+
+with state_lock:
+    _publish_enabled_scenarios()
+
+
+def _read_enabled_flag() -> Optional[bool]:
+    """Read the boolean "enabled" flag from a JSON request body, or None if invalid."""
+    try:
+        data = request.get_json(force=True, silent=True)
+    except Exception:
+        data = None
+
+    if not isinstance(data, dict):
+        return None
+    enabled = data.get("enabled")
+    # Reject strings like "false" rather than treating them as truthy
+    if not isinstance(enabled, bool):
+        return None
+    return enabled
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert read-only scenario configs, which orjson cannot serialize."""
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    raise TypeError
+
+
+def _json_response(obj: Any, status: int = 200) -> Response:
+    """Serialize obj with orjson into a JSON response."""
+    # Decoded Thrift maps may have non-string keys
+    return Response(
+        orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS),
+        status=status,
+        mimetype="application/json",
+    )
+
 
 # ===== Control API Endpoints =====
 
@@ -194,17 +387,8 @@ SCENARIOS = {
 @app.route("/scenarios", methods=["GET"])
 def list_scenarios():
     """List all available scenarios with their status."""
-    with state_lock:
-        scenarios_list = [
-            {
-                "name": name,
-                "description": config["description"],
-                "enabled": name in enabled_scenarios
-                and enabled_scenarios[name] is not False,
-            }
-            for name, config in SCENARIOS.items()
-        ]
-    return jsonify({"scenarios": scenarios_list})
+    # Published by _publish_enabled_scenarios, so no lock is needed here
+    return Response(scenarios_body, mimetype="application/json")
 
 
 @app.route("/scenarios/<scenario_name>/enable", methods=["POST"])
@@ -218,7 +402,7 @@ def enable_scenario(scenario_name):
     }
     """
     if scenario_name not in SCENARIOS:
-        return jsonify({"error": f"Scenario not found: {scenario_name}"}), 404
+        return _json_response({"error": f"Scenario not found: {scenario_name}"}, 404)
 
     # Check for runtime configuration
     try:
@@ -226,24 +410,31 @@ def enable_scenario(scenario_name):
     except Exception:
         data = None
 
-    scenario_config = SCENARIOS[scenario_name].copy()
+    # Scenario definitions are never mutated, so share them unless overridden
+    scenario_config = SCENARIOS[scenario_name]
 
     # Apply runtime overrides for configurable parameters
     if data:
         if "duration_seconds" in data and scenario_config.get("action") == "delay":
-            scenario_config["duration_seconds"] = int(data["duration_seconds"])
+            scenario_config = MappingProxyType(
+                {
+                    **scenario_config,
+                    "duration_seconds": int(data["duration_seconds"]),
+                }
+            )
             ctx.log.info(f"[API] Override delay duration: {data['duration_seconds']}s")
 
     with state_lock:
         # Store the potentially modified config
         enabled_scenarios[scenario_name] = scenario_config
+        _publish_enabled_scenarios()
         # Auto-reset call history when scenario is enabled (new test scenario)
-        call_history.clear()
+        _clear_call_history()
         # Reset call counts for trigger_after_count scenarios
         scenario_call_counts.clear()
 
     ctx.log.info(f"[API] Enabled scenario: {scenario_name}, reset call history")
-    return jsonify(
+    return _json_response(
         {
             "scenario": scenario_name,
             "enabled": True,
@@ -257,31 +448,31 @@ def enable_scenario(scenario_name):
 def disable_scenario(scenario_name):
     """Disable a failure scenario."""
     if scenario_name not in SCENARIOS:
-        return jsonify({"error": f"Scenario not found: {scenario_name}"}), 404
+        return _json_response({"error": f"Scenario not found: {scenario_name}"}, 404)
 
     with state_lock:
-        enabled_scenarios[scenario_name] = False
+        enabled_scenarios.pop(scenario_name, None)
+        _publish_enabled_scenarios()
 
     ctx.log.info(f"[API] Disabled scenario: {scenario_name}")
-    return jsonify({"scenario": scenario_name, "enabled": False})
+    return _json_response({"scenario": scenario_name, "enabled": False})
 
 
 @app.route("/scenarios/<scenario_name>/status", methods=["GET"])
 def get_scenario_status(scenario_name):
     """Get status of a specific scenario."""
     if scenario_name not in SCENARIOS:
-        return jsonify({"error": f"Scenario not found: {scenario_name}"}), 404
+        return _json_response({"error": f"Scenario not found: {scenario_name}"}, 404)
 
     with state_lock:
-        enabled_config = enabled_scenarios.get(scenario_name, False)
-        enabled = enabled_config is not False
+        enabled_config = enabled_scenarios.get(scenario_name)
 
-    return jsonify(
+    return _json_response(
         {
             "name": scenario_name,
             "description": SCENARIOS[scenario_name]["description"],
-            "enabled": enabled,
-            "config": enabled_config if enabled else None,
+            "enabled": enabled_config is not None,
+            "config": enabled_config,
         }
     )
 
@@ -290,34 +481,100 @@ def get_scenario_status(scenario_name):
 def disable_all_scenarios():
     """Disable all failure scenarios."""
     with state_lock:
-        for scenario_name in SCENARIOS.keys():
-            enabled_scenarios[scenario_name] = False
+        enabled_scenarios.clear()
+        _publish_enabled_scenarios()
 
     ctx.log.info("[API] Disabled all scenarios")
-    return jsonify({"message": "All scenarios disabled"})
+    return _json_response({"message": "All scenarios disabled"})
 
 
 @app.route("/thrift/calls", methods=["GET"])
 def get_thrift_calls():
     """Get history of Thrift method calls."""
+    # Only copy under the lock; serializing up to MAX_CALL_HISTORY records
+    # must not stall proxied requests waiting to append
     with state_lock:
-        return jsonify(
-            {
-                "calls": call_history.copy(),
-                "count": len(call_history),
-                "max_history": MAX_CALL_HISTORY,
-            }
-        )
+        calls = list(call_history)
+    return _json_response(
+        {
+            "calls": calls,
+            "count": len(calls),
+            "max_history": MAX_CALL_HISTORY,
+        }
+    )
 
 
 @app.route("/thrift/calls/reset", methods=["POST"])
 def reset_thrift_calls():
     """Reset Thrift call history."""
     with state_lock:
-        call_history.clear()
+        _clear_call_history()
 
     ctx.log.info("[API] Reset Thrift call history")
-    return jsonify({"message": "Call history reset", "count": 0})
+    return _json_response({"message": "Call history reset", "count": 0})
+
+
+@app.route("/tracking/cloud-downloads", methods=["POST"])
+def set_cloud_download_tracking():
+    """
+    Enable or disable recording of cloud downloads in call history.
+
+    Request body:
+    {
+        "enabled": true
+    }
+    """
+    global record_cloud_downloads
+    enabled = _read_enabled_flag()
+    if enabled is None:
+        return _json_response({"error": "enabled (boolean) required"}, 400)
+
+    record_cloud_downloads = enabled
+
+    ctx.log.info(f"[API] Cloud download tracking: {record_cloud_downloads}")
+    return _json_response({"enabled": record_cloud_downloads})
+
+
+@app.route("/thrift/decode-responses", methods=["POST"])
+def set_thrift_response_decoding():
+    """
+    Enable or disable decoding and logging of Thrift responses.
+
+    Request body:
+    {
+        "enabled": true
+    }
+    """
+    global decode_thrift_responses
+    enabled = _read_enabled_flag()
+    if enabled is None:
+        return _json_response({"error": "enabled (boolean) required"}, 400)
+
+    decode_thrift_responses = enabled
+
+    ctx.log.info(f"[API] Thrift response decoding: {decode_thrift_responses}")
+    return _json_response({"enabled": decode_thrift_responses})
+
+
+@app.route("/thrift/capture-fields", methods=["POST"])
+def set_thrift_field_capture():
+    """
+    Enable or disable keeping decoded request fields in call history.
+
+    Request body:
+    {
+        "enabled": true
+    }
+    """
+    global capture_thrift_fields
+    enabled = _read_enabled_flag()
+    if enabled is None:
+        return _json_response({"error": "enabled (boolean) required"}, 400)
+
+    capture_thrift_fields = enabled
+
+    ctx.log.info(f"[API] Thrift field capture: {capture_thrift_fields}")
+    return _json_response({"enabled": capture_thrift_fields})
 
 
 @app.route("/thrift/calls/verify", methods=["POST"])
@@ -358,28 +615,33 @@ def verify_thrift_calls():
         data = None
 
     if not data:
-        return jsonify({"error": "Request body required"}), 400
+        return _json_response({"error": "Request body required"}, 400)
 
     verification_type = data.get("type")
     if not verification_type:
-        return jsonify({"error": "Verification type required"}), 400
+        return _json_response({"error": "Verification type required"}, 400)
 
-    with state_lock:
-        methods = [call["method"] for call in call_history]
+    method_name = data.get("method")
+    if method_name is not None and not isinstance(method_name, str):
+        return _json_response({"error": "method must be a string"}, 400)
 
     try:
         if verification_type == "exact_sequence":
+            with state_lock:
+                methods = list(thrift_methods)
             expected = data.get("methods", [])
             if methods == expected:
-                return jsonify(
+                return _json_response(
                     {"verified": True, "actual": methods, "expected": expected}
                 )
             else:
-                return jsonify(
+                return _json_response(
                     {"verified": False, "actual": methods, "expected": expected}
                 )
 
         elif verification_type == "contains_sequence":
+            with state_lock:
+                methods = list(thrift_methods)
             expected = data.get("methods", [])
             # Check if expected sequence appears in order (but not necessarily consecutive)
             idx = 0
@@ -387,42 +649,46 @@ def verify_thrift_calls():
                 if idx < len(expected) and method == expected[idx]:
                     idx += 1
             verified = idx == len(expected)
-            return jsonify(
+            return _json_response(
                 {"verified": verified, "actual": methods, "expected": expected}
             )
 
         elif verification_type == "method_count":
-            method_name = data.get("method")
             expected_count = data.get("count")
             if not method_name or expected_count is None:
-                return jsonify({"error": "method and count required"}), 400
-            actual_count = methods.count(method_name)
-            verified = actual_count == expected_count
-            return jsonify(
+                return _json_response({"error": "method and count required"}, 400)
+            # method_count is answered from the counts alone
+            with state_lock:
+                method_calls = thrift_method_counts[method_name]
+            verified = method_calls == expected_count
+            return _json_response(
                 {
                     "verified": verified,
                     "method": method_name,
-                    "actual_count": actual_count,
+                    "actual_count": method_calls,
                     "expected_count": expected_count,
                 }
             )
 
         elif verification_type == "method_exists":
-            method_name = data.get("method")
             if not method_name:
-                return jsonify({"error": "method required"}), 400
-            verified = method_name in methods
-            return jsonify(
+                return _json_response({"error": "method required"}, 400)
+            with state_lock:
+                method_calls = thrift_method_counts[method_name]
+                methods = list(thrift_methods)
+            verified = method_calls > 0
+            return _json_response(
                 {"verified": verified, "method": method_name, "actual": methods}
             )
 
         else:
-            return jsonify(
-                {"error": f"Unknown verification type: {verification_type}"}
-            ), 400
+            return _json_response(
+                {"error": f"Unknown verification type: {verification_type}"},
+                400,
+            )
 
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return _json_response({"error": str(e)}, 500)
 
 
 # ===== mitmproxy Addon Class =====
@@ -435,16 +701,11 @@ class FailureInjectionAddon:
         """Initialize addon and start control API server."""
         ctx.log.info("Starting FailureInjectionAddon")
 
-        # Start Flask control API in background thread
+        # Start Flask control API in background thread, served by waitress
+        # rather than the Werkzeug development server. Tests poll the API
+        # between cases, so allow more concurrent requests than the default 4.
         def run_api():
-            # Disable reloader and use production mode for faster startup
-            app.run(
-                host="0.0.0.0",
-                port=18081,
-                threaded=True,
-                use_reloader=False,
-                debug=False,
-            )
+            serve(app, host="0.0.0.0", port=18081, threads=8)
 
         api_thread = threading.Thread(target=run_api, daemon=True, name="ControlAPI")
         api_thread.start()
@@ -456,75 +717,58 @@ class FailureInjectionAddon:
         Called by mitmproxy for each HTTP request.
         Made async to support non-blocking delays.
         """
-        # Detect request type
-        if self._is_cloudfetch_download(flow.request):
-            # Track cloud fetch download
-            with state_lock:
-                call_record = {
-                    "timestamp": time.time(),
-                    "type": "cloud_download",
-                    "url": flow.request.pretty_url,
-                }
-                call_history.append(call_record)
-
-                # Enforce max history limit
-                if len(call_history) > MAX_CALL_HISTORY:
-                    del call_history[: len(call_history) - MAX_CALL_HISTORY]
-
-            await self._handle_cloudfetch_request(flow)
-        elif self._is_thrift_request(flow.request):
-            self._handle_thrift_request(flow)
-            # Check for session-related failure scenarios
-            await self._handle_thrift_session_scenarios(flow)
-
-    def _is_cloudfetch_download(self, request: http.Request) -> bool:
-        """Detect if this is a CloudFetch download to cloud storage."""
-        if request.method != "GET":
-            return False
-
-        host = request.pretty_host.lower()
-        return (
-            "blob.core.windows.net" in host
-            or "s3.amazonaws.com" in host
-            or "storage.googleapis.com" in host
-        )
-
-    def _is_thrift_request(self, request: http.Request) -> bool:
+        # Dispatch on the method once: CloudFetch downloads are GETs to cloud
+        # storage, Thrift calls are POSTs to a SQL warehouse
+        req = flow.request
+        method = req.method
+
+        if method == "GET":
+            # pretty_host is computed on each access, so read it once
+            if self._is_cloud_storage_host(req.pretty_host):
+                # Track cloud fetch download if requested
+                if record_cloud_downloads:
+                    with state_lock:
+                        call_record = {
+                            "timestamp_ns": time.time_ns(),
+                            "type": "cloud_download",
+                            "url": req.pretty_url,
+                        }
+                        # Bounded deque drops the oldest call once full
+                        call_history.append(call_record)
+
+                await self._handle_cloudfetch_request(flow)
+        elif method == "POST":
+            if self._is_thrift_path(req.path):
+                self._handle_thrift_request(flow)
+                # Check for session-related failure scenarios
+                await self._handle_thrift_session_scenarios(flow)
+
+    @staticmethod
+    def _is_cloud_storage_host(host: str) -> bool:
+        """Detect if a GET to this host is a CloudFetch download."""
+        return host.lower().endswith(CLOUD_STORAGE_HOST_SUFFIXES)
+
+    @staticmethod
+    def _is_thrift_path(path: str) -> bool:
         """
-        Detect if this is a Thrift request to Databricks SQL warehouse.
+        Detect if a POST to this path is a Thrift request to a SQL warehouse.
 
         Distinguishes Thrift API from SEA (SQL Execution API):
         - Thrift: POST /sql/1.0/warehouses/{warehouse_id} or POST /sql/1.0/endpoints/{endpoint_id}
         - SEA: POST /api/2.0/sql/statements
         """
-        if request.method != "POST":
-            return False
-
-        # Thrift requests use /sql/1.0/warehouses/ or /sql/1.0/endpoints/ paths
         # SEA requests use /api/2.0/sql/statements path
-        return (
-            "/sql/1.0/warehouses/" in request.path
-            or "/sql/1.0/endpoints/" in request.path
-        )
+        return THRIFT_PATH_RE.search(path) is not None
 
     async def _handle_cloudfetch_request(self, flow: http.HTTPFlow) -> None:
         """Handle CloudFetch requests and inject failures if scenario is enabled."""
-        with state_lock:
-            # Find first enabled CloudFetch scenario
-            enabled_scenario = None
-            for name in enabled_scenarios:
-                scenario_config = enabled_scenarios[name]
-                if scenario_config is not False:
-                    # scenario_config is now the full config dict
-                    base_config = SCENARIOS.get(name, {})
-                    if base_config.get("operation") == "CloudFetchDownload":
-                        enabled_scenario = (name, scenario_config)
-                        break
-
-        if not enabled_scenario:
+        # Use the first enabled CloudFetch scenario
+        enabled = enabled_by_operation.get("CloudFetchDownload")
+        if not enabled:
             return  # No scenario enabled, let request proceed normally
 
-        scenario_name, scenario_config = enabled_scenario
+        # scenario_config is the full config dict
+        scenario_name, scenario_config = enabled[0]
         ctx.log.info(
             f"[INJECT] Triggering scenario: {scenario_name} for {flow.request.pretty_url}"
         )
@@ -535,34 +779,25 @@ class FailureInjectionAddon:
         if action == "expire_cloud_link":
             # Return 403 with Azure expired signature error
             flow.response = http.Response.make(
-                403,
-                b"AuthorizationQueryParametersError: Query Parameters are not supported for this operation",
-                {"Content-Type": "text/plain"},
+                403, EXPIRED_LINK_BODY, TEXT_PLAIN_HEADERS
             )
             self._disable_scenario(scenario_name)
 
         elif action == "return_error":
             # Return HTTP error with specified code and message
-            error_code = scenario_config.get("error_code", 500)
-            error_message = scenario_config.get(
-                "error_message", "Internal Server Error"
-            )
-            flow.response = http.Response.make(
-                error_code,
-                error_message.encode("utf-8"),
-                {"Content-Type": "text/plain"},
-            )
+            flow.response = http.Response.make(*ERROR_RESPONSES[scenario_name])
             self._disable_scenario(scenario_name)
 
         elif action == "delay":
             # Inject delay using asyncio.sleep() to avoid blocking the event loop
-            import asyncio
-
             duration_seconds = scenario_config.get("duration_seconds", 5)
             ctx.log.info(
                 f"[INJECT] Delaying {duration_seconds}s for scenario: {scenario_name}"
             )
-            # Disable BEFORE the delay so new requests don't trigger this scenario
+            # Disable BEFORE the delay so new requests don't trigger this scenario.
+            # There is no await between the lookup and this call, so exactly one
+            # flow per enable is delayed; concurrent downloads never pile up
+            # behind the same scenario.
             self._disable_scenario(scenario_name)
             await asyncio.sleep(duration_seconds)
             ctx.log.info(f"[INJECT] Delay complete for scenario: {scenario_name}")
@@ -571,13 +806,17 @@ class FailureInjectionAddon:
         elif action == "close_connection":
             # Kill the connection abruptly
             flow.response = http.Response.make(
-                500, b"Connection reset by peer", {"Content-Type": "text/plain"}
+                500, CONNECTION_RESET_BODY, TEXT_PLAIN_HEADERS
             )
             flow.kill()
             self._disable_scenario(scenario_name)
 
     async def _handle_thrift_session_scenarios(self, flow: http.HTTPFlow) -> None:
         """Handle Thrift session-related failure scenarios."""
+        # Skip decoding entirely when no scenario is enabled
+        if not enabled_by_operation:
+            return
+
         # Decode the Thrift request to determine the operation type
         if not flow.request.content:
             return
@@ -588,31 +827,30 @@ class FailureInjectionAddon:
 
         method_name = decoded.get("method", "")
 
-        # Find enabled scenario that matches this Thrift operation
-        with state_lock:
-            enabled_scenario = None
-            for name in enabled_scenarios:
-                scenario_config = enabled_scenarios[name]
-                if scenario_config is not False:
-                    base_config = SCENARIOS.get(name, {})
-                    operation = base_config.get("operation", "")
-
-                    # Check if this scenario matches the operation
-                    if operation == "ThriftOperation" or operation == method_name:
-                        # Check trigger_after_count if specified
-                        trigger_after = base_config.get("trigger_after_count", 0)
-                        if trigger_after > 0:
-                            # Track call count for this scenario + method combination
-                            key = f"{name}:{method_name}"
-                            current_count = scenario_call_counts.get(key, 0)
-                            scenario_call_counts[key] = current_count + 1
-
-                            # Only trigger if we've reached the threshold
-                            if scenario_call_counts[key] <= trigger_after:
-                                continue  # Skip this scenario for now
-
-                        enabled_scenario = (name, scenario_config, base_config)
-                        break
+        # Find the first enabled scenario that matches this Thrift operation.
+        # Method buckets already hold ThriftOperation scenarios in enable order.
+        candidates = enabled_by_operation.get(method_name)
+        if candidates is None:
+            candidates = enabled_by_operation.get("ThriftOperation", ())
+        enabled_scenario = None
+        for name, scenario_config in candidates:
+            base_config = SCENARIOS[name]
+
+            # Check trigger_after_count if specified
+            trigger_after = base_config.get("trigger_after_count", 0)
+            if trigger_after > 0:
+                # Track call count for this scenario + method combination
+                key = f"{name}:{method_name}"
+                with state_lock:
+                    scenario_call_counts[key] = scenario_call_counts.get(key, 0) + 1
+                    call_count = scenario_call_counts[key]
+
+                # Only trigger if we've reached the threshold
+                if call_count <= trigger_after:
+                    continue  # Skip this scenario for now
+
+            enabled_scenario = (name, scenario_config, base_config)
+            break
 
         if not enabled_scenario:
             return  # No matching scenario enabled
@@ -626,38 +864,21 @@ class FailureInjectionAddon:
 
         if action == "return_thrift_error":
             # Create a Thrift error response
-            # For simplicity, return HTTP 500 with error message
-            # A full implementation would construct proper Thrift error response
-            error_message = base_config.get("error_message", "Thrift operation failed")
-            error_type = base_config.get("error_type", "UNKNOWN_ERROR")
-
-            flow.response = http.Response.make(
-                500,
-                f"Thrift Error [{error_type}]: {error_message}".encode("utf-8"),
-                {"Content-Type": "application/x-thrift"},
-            )
+            flow.response = http.Response.make(*ERROR_RESPONSES[scenario_name])
             self._disable_scenario(scenario_name)
 
         elif action == "return_auth_error":
             # Return HTTP 401 for authentication failures (non-retryable)
-            error_message = base_config.get("error_message", "Authentication failed")
-            error_type = base_config.get("error_type", "UNAUTHORIZED")
-
-            flow.response = http.Response.make(
-                401,
-                f"Authentication Error [{error_type}]: {error_message}".encode("utf-8"),
-                {"Content-Type": "application/x-thrift"},
-            )
+            flow.response = http.Response.make(*ERROR_RESPONSES[scenario_name])
             self._disable_scenario(scenario_name)
 
         elif action == "delay":
             # Inject delay for slow operations
-            import asyncio
-
             duration_seconds = base_config.get("duration_seconds", 5)
             ctx.log.info(
                 f"[INJECT] Delaying {duration_seconds}s for Thrift scenario: {scenario_name}"
             )
+            # Disable BEFORE the delay, as for CloudFetch delays
             self._disable_scenario(scenario_name)
             await asyncio.sleep(duration_seconds)
             ctx.log.info(
@@ -666,19 +887,13 @@ class FailureInjectionAddon:
 
         elif action == "return_error":
             # Return HTTP error with specified code and message
-            error_code = base_config.get("error_code", 500)
-            error_message = base_config.get("error_message", "Internal Server Error")
-            flow.response = http.Response.make(
-                error_code,
-                error_message.encode("utf-8"),
-                {"Content-Type": "text/plain"},
-            )
+            flow.response = http.Response.make(*ERROR_RESPONSES[scenario_name])
             self._disable_scenario(scenario_name)
 
         elif action == "close_connection":
             # Kill the connection abruptly
             flow.response = http.Response.make(
-                500, b"Connection reset by peer", {"Content-Type": "text/plain"}
+                500, CONNECTION_RESET_BODY, TEXT_PLAIN_HEADERS
             )
             flow.kill()
             self._disable_scenario(scenario_name)
@@ -692,31 +907,41 @@ class FailureInjectionAddon:
             # Don't disable - let the request proceed normally
             # Tests can verify behavior via call tracking
 
+    @staticmethod
+    def _info_logging_enabled() -> bool:
+        """Whether the mitmproxy log level lets INFO messages through."""
+        verbosity = getattr(ctx.options, "termlog_verbosity", "info")
+        return verbosity in INFO_LOG_VERBOSITIES
+
     def _handle_thrift_request(self, flow: http.HTTPFlow) -> None:
         """Handle Thrift requests, log decoded messages, and track call history."""
-        # Decode and log Thrift request
+        # Decode and log Thrift request. Decoding stays outside state_lock so
+        # only the history append below holds the lock.
         if flow.request.content:
             decoded = decode_thrift_message(flow.request.content)
             if decoded and "error" not in decoded:
-                formatted = format_thrift_message(decoded, max_field_length=100)
-                ctx.log.info(f"[THRIFT REQUEST]\n{formatted}")
+                # Formatting is wasted work when INFO messages are filtered
+                if self._info_logging_enabled():
+                    formatted = format_thrift_message(decoded, max_field_length=100)
+                    ctx.log.info(f"[THRIFT REQUEST]\n{formatted}")
 
                 # Track call in history
+                method = decoded.get("method", "unknown")
+                call_record = {
+                    "timestamp_ns": time.time_ns(),
+                    "type": "thrift",
+                    "method": method,
+                    "message_type": decoded.get("message_type", "unknown"),
+                    "sequence_id": decoded.get("sequence_id", 0),
+                }
+                # Decoded fields can be large; only retain them on request
+                if capture_thrift_fields:
+                    call_record["fields"] = decoded.get("fields", {})
+
                 with state_lock:
-                    call_record = {
-                        "timestamp": time.time(),
-                        "type": "thrift",
-                        "method": decoded.get("method", "unknown"),
-                        "message_type": decoded.get("message_type", "unknown"),
-                        "sequence_id": decoded.get("sequence_id", 0),
-                        "fields": decoded.get("fields", {}),
-                    }
+                    # Bounded deque drops the oldest call once full
                     call_history.append(call_record)
-
-                    # Enforce max history limit
-                    if len(call_history) > MAX_CALL_HISTORY:
-                        # Remove oldest calls to stay within limit
-                        del call_history[: len(call_history) - MAX_CALL_HISTORY]
+                    _record_thrift_method(method)
 
             elif decoded:
                 ctx.log.warn(f"[THRIFT REQUEST] Decode error: {decoded.get('error')}")
@@ -726,12 +951,21 @@ class FailureInjectionAddon:
         Intercept responses to log Thrift messages.
         Called by mitmproxy for each HTTP response.
         """
-        if self._is_thrift_request(flow.request) and flow.response:
+        # Responses are only decoded for logging; nothing else consumes them
+        if not decode_thrift_responses:
+            return
+
+        if (
+            flow.request.method == "POST"
+            and self._is_thrift_path(flow.request.path)
+            and flow.response
+        ):
             if flow.response.content:
                 decoded = decode_thrift_message(flow.response.content)
                 if decoded and "error" not in decoded:
-                    formatted = format_thrift_message(decoded, max_field_length=100)
-                    ctx.log.info(f"[THRIFT RESPONSE]\n{formatted}")
+                    if self._info_logging_enabled():
+                        formatted = format_thrift_message(decoded, max_field_length=100)
+                        ctx.log.info(f"[THRIFT RESPONSE]\n{formatted}")
                 elif decoded:
                     ctx.log.warn(
                         f"[THRIFT RESPONSE] Decode error: {decoded.get('error')}"
@@ -740,7 +974,8 @@ class FailureInjectionAddon:
     def _disable_scenario(self, scenario_name: str) -> None:
         """Disable a scenario after one-shot injection."""
         with state_lock:
-            enabled_scenarios[scenario_name] = False
+            enabled_scenarios.pop(scenario_name, None)
+            _publish_enabled_scenarios()
         ctx.log.info(f"[INJECT] Auto-disabled scenario: {scenario_name}")
 
 
@@ -135,6 +135,8 @@ namespace AdbcDrivers.Databricks.Tests.ThriftProtocol
                 ["adbc.databricks.cloudfetch.timeout_minutes"] = "1"
             };
 
+            await ControlClient.SetCloudDownloadTrackingAsync(true);
+
             int baselineCloudDownloads;
             using (var connection = CreateProxiedConnectionWithParameters(timeoutParams))
             using (var statement = connection.CreateStatement())
@@ -207,6 +209,8 @@ namespace AdbcDrivers.Databricks.Tests.ThriftProtocol
         public async Task CloudFetchConnectionReset_RetriesWithExponentialBackoff()
         {
             // Arrange - First establish baseline by running query without failure scenario
+            await ControlClient.SetCloudDownloadTrackingAsync(true);
+
             int baselineCloudDownloads;
             using (var connection = CreateProxiedConnection())
             using (var statement = connection.CreateStatement())
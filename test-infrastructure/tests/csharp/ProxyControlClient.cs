@@ -160,6 +160,42 @@ namespace AdbcDrivers.Databricks.Tests.ThriftProtocol
             return history ?? new ThriftCallHistory();
         }
 
+        /// <summary>
+        /// Enables or disables recording of cloud downloads in the call history.
+        /// Downloads are not recorded unless tracking is enabled.
+        /// </summary>
+        public async Task SetCloudDownloadTrackingAsync(bool enabled, CancellationToken cancellationToken = default)
+        {
+            var json = System.Text.Json.JsonSerializer.Serialize(new { enabled });
+            using var content = new StringContent(json, System.Text.Encoding.UTF8, "application/json");
+            var response = await _httpClient.PostAsync("/tracking/cloud-downloads", content, cancellationToken);
+            response.EnsureSuccessStatusCode();
+        }
+
+        /// <summary>
+        /// Enables or disables decoding and logging of Thrift responses.
+        /// Responses are not decoded unless decoding is enabled.
+        /// </summary>
+        public async Task SetThriftResponseDecodingAsync(bool enabled, CancellationToken cancellationToken = default)
+        {
+            var json = System.Text.Json.JsonSerializer.Serialize(new { enabled });
+            using var content = new StringContent(json, System.Text.Encoding.UTF8, "application/json");
+            var response = await _httpClient.PostAsync("/thrift/decode-responses", content, cancellationToken);
+            response.EnsureSuccessStatusCode();
+        }
+
+        /// <summary>
+        /// Enables or disables keeping decoded request fields in the call history.
+        /// <see cref="ThriftCall.Fields"/> is only populated while capture is enabled.
+        /// </summary>
+        public async Task SetThriftFieldCaptureAsync(bool enabled, CancellationToken cancellationToken = default)
+        {
+            var json = System.Text.Json.JsonSerializer.Serialize(new { enabled });
+            using var content = new StringContent(json, System.Text.Encoding.UTF8, "application/json");
+            var response = await _httpClient.PostAsync("/thrift/capture-fields", content, cancellationToken);
+            response.EnsureSuccessStatusCode();
+        }
+
         /// <summary>
         /// Counts how many times a specific Thrift method was called.
         /// </summary>
@@ -227,12 +263,13 @@ namespace AdbcDrivers.Databricks.Tests.ThriftProtocol
     /// </summary>
     public class ThriftCall
     {
-        public double Timestamp { get; set; }
+        [System.Text.Json.Serialization.JsonPropertyName("timestamp_ns")]
+        public long TimestampNs { get; set; } // Unix epoch nanoseconds
         public string Type { get; set; } = string.Empty; // "thrift" or "cloud_download"
         public string Method { get; set; } = string.Empty; // For Thrift calls
         public string MessageType { get; set; } = string.Empty; // For Thrift calls
         public int SequenceId { get; set; } // For Thrift calls
-        public System.Text.Json.JsonElement? Fields { get; set; } // For Thrift calls
+        public System.Text.Json.JsonElement? Fields { get; set; } // For Thrift calls, when field capture is enabled
         public string Url { get; set; } = string.Empty; // For cloud downloads
     }
 }
@@ -69,6 +69,9 @@ namespace AdbcDrivers.Databricks.Tests.ThriftProtocol
 
                 // Ensure all scenarios are disabled at the start of each test
                 await _controlClient.DisableAllScenariosAsync();
+                await _controlClient.SetCloudDownloadTrackingAsync(false);
+                await _controlClient.SetThriftResponseDecodingAsync(false);
+                await _controlClient.SetThriftFieldCaptureAsync(false);
             }
             catch (Exception ex)
             {
@@ -88,8 +91,11 @@ namespace AdbcDrivers.Databricks.Tests.ThriftProtocol
             {
                 try
                 {
-                    // Clean up: disable all scenarios
+                    // Clean up: disable all scenarios and opt-in proxy toggles
                     await _controlClient.DisableAllScenariosAsync();
+                    await _controlClient.SetCloudDownloadTrackingAsync(false);
+                    await _controlClient.SetThriftResponseDecodingAsync(false);
+                    await _controlClient.SetThriftFieldCaptureAsync(false);
                 }
                 catch (Exception)
                 {